@@ -1,4 +1,6 @@
 import os.path
+from functools import lru_cache
+from types import MappingProxyType
 
 from Orange.data.table import Table
 from Orange.data.io import \
@@ -13,6 +15,27 @@ from Orange.widgets.utils.widgetpreview import WidgetPreview
 _userhome = os.path.expanduser(f"~{os.sep}")
 
 
+@lru_cache(maxsize=8)
+def _filters_for_formats(formats, builtin_order):
+    """
+    Return a read-only mapping from filters to writers among `formats`.
+
+    Writers in `builtin_order` come first, in that order.
+    """
+    writers = [format for format in formats
+               if getattr(format, 'write_file', None)
+               and getattr(format, "EXTENSIONS", None)]
+    writers.sort(key=lambda writer: builtin_order.index(writer)
+                 if writer in builtin_order else 99)
+
+    return MappingProxyType({
+        **{f"{w.DESCRIPTION} (*{w.EXTENSIONS[0]})": w
+           for w in writers},
+        **{f"Compressed {w.DESCRIPTION} (*{w.EXTENSIONS[0]}.gz)": w
+           for w in writers if w.SUPPORT_COMPRESSED}
+    })
+
+
 class OWSave(OWSaveBase):
     name = "Save Data"
     description = "Save data to an output file."
@@ -48,18 +71,10 @@ class OWSave(OWSaveBase):
 
     @classmethod
     def get_filters(cls):
-        writers = [format for format in FileFormat.formats
-                   if getattr(format, 'write_file', None)
-                   and getattr(format, "EXTENSIONS", None)]
-        writers.sort(key=lambda writer: cls.builtin_order.index(writer)
-                     if writer in cls.builtin_order else 99)
-
-        return {
-            **{f"{w.DESCRIPTION} (*{w.EXTENSIONS[0]})": w
-               for w in writers},
-            **{f"Compressed {w.DESCRIPTION} (*{w.EXTENSIONS[0]}.gz)": w
-               for w in writers if w.SUPPORT_COMPRESSED}
-        }
+        # Add-ons can register formats later, so filters are cached by the
+        # current contents of the registry
+        return _filters_for_formats(
+            tuple(FileFormat.formats), tuple(cls.builtin_order))
 
     @Inputs.data
     def dataset(self, data):
@@ -127,7 +142,7 @@ class OWSave(OWSaveBase):
                 settings["add_type_annotations"] = False
 
     def initial_start_dir(self):
-        if self.filename and os.path.exists(os.path.split(self.filename)[0]):
+        if self.stored_name and self._last_dir_exists():
             return self.filename
         else:
             data_name = getattr(self.data, 'name', '')
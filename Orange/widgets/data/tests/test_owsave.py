@@ -11,6 +11,7 @@ from Orange.data import Table
 from Orange.data.io import TabReader, PickleReader, ExcelReader, FileFormat
 from Orange.tests import named_file
 from Orange.widgets.data.owsave import OWSave, OWSaveBase
+from Orange.widgets.utils.save.owsavebase import _GenericIconProvider
 from Orange.widgets.utils.save.tests.test_owsavebase import \
     SaveWidgetsTestBaseMixin
 from Orange.widgets.tests.base import WidgetTest, open_widget_classes
@@ -296,6 +297,26 @@ class TestOWSave(OWSaveTestBase):
         self.assertIn(MockFormat, self.widget.valid_filters().values())
         # this test doesn't call it - test_save_uncompressed does
 
+    def test_filters_follow_registry(self):
+        filters = OWSave.get_filters()
+        self.assertIs(OWSave.get_filters(), filters)
+        with self.assertRaises(TypeError):
+            filters["foo (*.foo)"] = None
+
+        class MockFormat2(FileFormat):
+            EXTENSIONS = ('.mock2',)
+            DESCRIPTION = "Another mock file format"
+
+            @staticmethod
+            def write_file(filename, data):
+                pass
+
+        try:
+            self.assertIn(MockFormat2, OWSave.get_filters().values())
+        finally:
+            del FileFormat.registry["MockFormat2"]
+        self.assertNotIn(MockFormat2, OWSave.get_filters().values())
+
     def test_send_report(self):
         widget = self.widget
 
@@ -506,6 +527,17 @@ class TestOWSaveLinuxDialog(OWSaveTestBase):
         dialog.selectFile("high.tab.gz.tab.tab.gz")
         self.assertTrue(dialog.selectedFiles()[0].endswith("/high.csv"))
 
+    def test_save_file_dialog_options_linux(self):
+        dialog = OWSave.SaveFileDialog(
+            OWSave, None, "Save File", "foo.bar",
+            "Bar files (*.tab);;Low files (*.csv)")
+        for option in (QFileDialog.DontUseNativeDialog,
+                       QFileDialog.DontUseCustomDirectoryIcons,
+                       QFileDialog.DontResolveSymlinks):
+            self.assertTrue(dialog.testOption(option))
+        self.assertEqual(dialog.viewMode(), QFileDialog.List)
+        self.assertIsInstance(dialog.iconProvider(), _GenericIconProvider)
+
     def test_save_file_dialog_uses_valid_filters_linux(self):
         widget = self.widget
         widget.valid_filters = lambda: ["a (*.a)", "b (*.b)"]
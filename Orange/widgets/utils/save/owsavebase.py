@@ -1,8 +1,11 @@
 import os.path
 import sys
 import re
+from functools import lru_cache
 
-from AnyQt.QtWidgets import QFileDialog, QGridLayout, QMessageBox
+from AnyQt.QtCore import QFileInfo
+from AnyQt.QtWidgets import \
+    QFileDialog, QFileIconProvider, QGridLayout, QMessageBox
 
 from Orange.widgets import gui, widget
 from Orange.widgets.settings import Setting
@@ -10,6 +13,92 @@ from Orange.widgets.settings import Setting
 
 _userhome = os.path.expanduser(f"~{os.sep}")
 
+_FILTER_EXT_RE = re.compile(r".*\(\*?(\..*)\)$")
+
+
+def _parse_filter_extension(selected_filter):
+    # Filters are usually of form "Description (*.ext)" or "... (.ext)";
+    # parse these with string methods and use the regex for anything else
+    if selected_filter.endswith(")"):
+        start = selected_filter.rfind("(")
+        if start != -1:
+            ext = selected_filter[start + 1:-1]
+            if ext.startswith("*."):
+                return ext[1:]
+            if ext.startswith("."):
+                return ext
+    return _FILTER_EXT_RE.search(selected_filter).group(1)
+
+
+@lru_cache(maxsize=32)
+def _extensions_in_filters(filters, extension_from_filter):
+    """
+    Return a set of all extensions (without dots) that appear in `filters`.
+
+    `filters` must be a tuple to be hashable; `extension_from_filter` is
+    the function that extracts the extension from a filter. The result is
+    cached because it is needed on every change of file name in the save
+    dialog.
+    """
+    known_extensions = set()
+    for filt in filters:
+        known_extensions.update(extension_from_filter(filt).split("."))
+    known_extensions.discard("")
+    return frozenset(known_extensions)
+
+
+class _GenericIconProvider(QFileIconProvider):
+    """
+    Icon provider that shows the same icon for all files and for all folders.
+
+    The default provider queries the system for an icon of each file, which
+    is slow in large directories and on network mounts.
+    """
+    def icon(self, arg):
+        if isinstance(arg, QFileInfo):
+            arg = QFileIconProvider.Folder if arg.isDir() \
+                else QFileIconProvider.File
+        return super().icon(arg)
+
+
+class _SaveFileDialogLinux(QFileDialog):
+    """
+    A non-native save dialog that enforces the extension of the chosen filter.
+
+    Used on Linux and unknown platforms; see `OWSaveBase.get_save_filename`.
+    Functions for parsing filters and replacing extensions are taken from
+    `save_cls` at construction, so signal handlers do not need to look them up.
+    """
+    def __init__(self, save_cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # pylint: disable=protected-access
+        self.save_cls = save_cls
+        self._extension_from_filter = save_cls._extension_from_filter
+        self._replace_extension = save_cls._replace_extension
+        self.suffix = ""
+        self.setAcceptMode(QFileDialog.AcceptSave)
+        self.setOption(QFileDialog.DontUseNativeDialog)
+        # Avoid per-file stat and icon lookups on large or remote directories
+        self.setOption(QFileDialog.DontUseCustomDirectoryIcons)
+        self.setOption(QFileDialog.DontResolveSymlinks)
+        self.setViewMode(QFileDialog.List)
+        self.__icon_provider = _GenericIconProvider()
+        self.setIconProvider(self.__icon_provider)
+        self.filterSelected.connect(self.updateDefaultExtension)
+
+    def selectNameFilter(self, selected_filter):
+        super().selectNameFilter(selected_filter)
+        self.updateDefaultExtension(selected_filter)
+
+    def updateDefaultExtension(self, selected_filter):
+        self.suffix = self._extension_from_filter(selected_filter)
+        files = self.selectedFiles()
+        if files and not os.path.isdir(files[0]):
+            self.selectFile(files[0])
+
+    def selectFile(self, filename):
+        super().selectFile(self._replace_extension(filename, self.suffix))
+
 
 class OWSaveBase(widget.OWWidget, openclass=True):
     """
@@ -86,6 +175,7 @@ class OWSaveBase(widget.OWWidget, openclass=True):
         super().__init__()
         self.data = None
         self.__show_auto_save_disabled = False
+        self.__existing_dir = None  # the last directory known to exist
         self._absolute_path = self._abs_path_from_setting()
 
         # This cannot be done outside because `filters` is defined by subclass
@@ -200,17 +290,26 @@ class OWSaveBase(widget.OWWidget, openclass=True):
         """
         This method must be called from input signal handler.
 
-        - It clears errors, warnings and information and calls
-          `self.update_messages` to set the as needed.
+        - It calls `self.update_messages` to set messages as needed, and
+          then clears all other errors, warnings and information.
         - It also calls `update_status` the can be overriden in derived
           methods to set the status (e.g. the number of input rows)
         - Calls `self.save_file` if `self.auto_save` is enabled and
           `self.filename` is provided.
         """
-        self.Error.clear()
-        self.Warning.clear()
-        self.Information.clear()
-        self.update_messages()
+        # Clearing all messages first would hide and show again those that
+        # remain shown; instead, clear only those not set by update_messages
+        shown = set()
+        collect = shown.add
+        self.messageActivated.connect(collect)
+        try:
+            self.update_messages()
+        finally:
+            self.messageActivated.disconnect(collect)
+        for group in (self.Error, self.Warning, self.Information):
+            for msg in list(group.active):
+                if msg not in shown:
+                    msg.clear()
         self.update_status()
         if self.auto_save and self.filename:
             self.save_file()
@@ -295,11 +394,26 @@ class OWSaveBase(widget.OWWidget, openclass=True):
 
         Return either the current file's path, the last directory or home.
         """
-        if self.filename and os.path.exists(os.path.split(self.filename)[0]):
+        # Directory of `filename` is `last_dir`; no need to join and split
+        if self.stored_name and self._last_dir_exists():
             return self.filename
         else:
             return self.last_dir or _userhome
 
+    def _last_dir_exists(self):
+        """
+        Tell whether `last_dir` exists.
+
+        A directory that was found to exist is not checked again, since
+        checking can be slow on network mounts.
+        """
+        path = self.last_dir
+        if path != self.__existing_dir:
+            if not os.path.exists(path):
+                return False
+            self.__existing_dir = path
+        return True
+
     @staticmethod
     def suggested_name():
         """
@@ -316,11 +430,7 @@ class OWSaveBase(widget.OWWidget, openclass=True):
         including omitting some, like turning iris.tab.gz to iris.gz. This
         function removes anything that can appear anywhere.
         """
-        known_extensions = set()
-        for filt in cls.get_filters():
-            known_extensions |= set(cls._extension_from_filter(filt).split("."))
-        if "" in known_extensions:
-            known_extensions.remove("")
+        known_extensions = cls._known_extensions()
         while True:
             base, ext = os.path.splitext(filename)
             if ext[1:] not in known_extensions:
@@ -328,9 +438,17 @@ class OWSaveBase(widget.OWWidget, openclass=True):
             filename = base
         return filename + extension
 
+    @classmethod
+    def _known_extensions(cls):
+        """Return a set of extensions (without dots) from all filters"""
+        # Filters are not necessarily static (see OWSave.get_filters), hence
+        # the cache is keyed by filters and not by class
+        return _extensions_in_filters(
+            tuple(cls.get_filters()), cls._extension_from_filter)
+
     @staticmethod
     def _extension_from_filter(selected_filter):
-        return re.search(r".*\(\*?(\..*)\)$", selected_filter).group(1)
+        return _parse_filter_extension(selected_filter)
 
     def valid_filters(self):
         return self.get_filters()
@@ -356,22 +474,25 @@ class OWSaveBase(widget.OWWidget, openclass=True):
         # if the file exists and ask whether to override.
         # It is a bit confusing that the user does not see the final name in the
         # dialog, but I see no better solution.
-        def get_save_filename(self):  # pragma: no cover
-            if sys.platform == "darwin":
-                def remove_star(filt):
-                    return filt.replace(" (*.", " (.")
-            else:
-                def remove_star(filt):
-                    return filt
+        if sys.platform == "darwin":
+            @staticmethod
+            def _remove_star(filt):
+                return filt.replace(" (*.", " (.")
+        else:
+            @staticmethod
+            def _remove_star(filt):
+                return filt
 
-            no_ext_filters = {remove_star(f): f for f in self.valid_filters()}
-            filename = self.initial_start_dir()
+        def get_save_filename(self):  # pragma: no cover
+            no_ext_filters = {self._remove_star(f): f
+                              for f in self.valid_filters()}
+            dlg = QFileDialog(
+                None, "Save File", self.initial_start_dir(),
+                ";;".join(no_ext_filters))
+            dlg.setAcceptMode(dlg.AcceptSave)
+            dlg.selectNameFilter(self._remove_star(self.default_valid_filter()))
+            dlg.setOption(QFileDialog.DontConfirmOverwrite)
             while True:
-                dlg = QFileDialog(
-                    None, "Save File", filename, ";;".join(no_ext_filters))
-                dlg.setAcceptMode(dlg.AcceptSave)
-                dlg.selectNameFilter(remove_star(self.default_valid_filter()))
-                dlg.setOption(QFileDialog.DontConfirmOverwrite)
                 if dlg.exec() == QFileDialog.Rejected:
                     return "", ""
                 filename = dlg.selectedFiles()[0]
@@ -383,6 +504,7 @@ class OWSaveBase(widget.OWWidget, openclass=True):
                         f"File {os.path.split(filename)[1]} already exists.\n"
                         "Overwrite?") == QMessageBox.Yes:
                     return filename, selected_filter
+                dlg.selectFile(filename)
 
     else:  # Linux and any unknown platforms
         # Qt does not use a native dialog on Linux, so we can connect to
@@ -390,31 +512,7 @@ class OWSaveBase(widget.OWWidget, openclass=True):
         # while the dialog is open.
         # For unknown platforms (which?), we also use the non-native dialog to
         # be sure we know what happens.
-        class SaveFileDialog(QFileDialog):
-            # pylint: disable=protected-access
-            def __init__(self, save_cls, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-                self.save_cls = save_cls
-                self.suffix = ""
-                self.setAcceptMode(QFileDialog.AcceptSave)
-                self.setOption(QFileDialog.DontUseNativeDialog)
-                self.filterSelected.connect(self.updateDefaultExtension)
-
-            def selectNameFilter(self, selected_filter):
-                super().selectNameFilter(selected_filter)
-                self.updateDefaultExtension(selected_filter)
-
-            def updateDefaultExtension(self, selected_filter):
-                self.suffix = \
-                    self.save_cls._extension_from_filter(selected_filter)
-                files = self.selectedFiles()
-                if files and not os.path.isdir(files[0]):
-                    self.selectFile(files[0])
-
-            def selectFile(self, filename):
-                filename = \
-                    self.save_cls._replace_extension(filename, self.suffix)
-                super().selectFile(filename)
+        SaveFileDialog = _SaveFileDialogLinux
 
         def get_save_filename(self):
             dlg = self.SaveFileDialog(
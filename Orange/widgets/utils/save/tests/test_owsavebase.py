@@ -13,7 +13,8 @@ import collections
 from orangewidget.widget import Input
 from Orange.widgets.tests.base import WidgetTest
 from Orange.widgets.utils import getmembers
-from Orange.widgets.utils.save.owsavebase import OWSaveBase, _userhome
+from Orange.widgets.utils.save.owsavebase import \
+    OWSaveBase, _userhome, _parse_filter_extension, _FILTER_EXT_RE
 
 
 class SaveWidgetsTestBaseMixin:
@@ -357,6 +358,46 @@ class TestOWSaveBase(WidgetTest):
         self.assertIs(widget.valid_filters(), widget.get_filters())
         self.assertIs(widget.default_valid_filter(), widget.filter)
 
+    def test_on_new_input_keeps_shown_messages(self):
+        widget = self.widget
+        widget.filename = ""
+        widget.auto_save = True
+        widget.on_new_input()
+        self.assertTrue(widget.Error.no_file_name.is_shown())
+
+        deactivated = Mock()
+        widget.messageDeactivated.connect(deactivated)
+
+        widget.Error.general_error("foo")
+        widget.on_new_input()
+        self.assertTrue(widget.Error.no_file_name.is_shown())
+        self.assertFalse(widget.Error.general_error.is_shown())
+        deactivated.assert_called_once_with(widget.Error.general_error)
+
+        deactivated.reset_mock()
+        widget.auto_save = False
+        widget.on_new_input()
+        self.assertFalse(widget.Error.no_file_name.is_shown())
+        deactivated.assert_called_once_with(widget.Error.no_file_name)
+
+    def test_initial_start_dir_checks_existing_dir_once(self):
+        widget = self.widget
+        widget.filename = "/foo/bar/baz.csv"
+        with patch("os.path.exists", return_value=False) as exists:
+            self.assertNotEqual(widget.initial_start_dir(), widget.filename)
+            self.assertNotEqual(widget.initial_start_dir(), widget.filename)
+            self.assertEqual(exists.call_count, 2)
+
+            exists.reset_mock()
+            exists.return_value = True
+            self.assertEqual(widget.initial_start_dir(), widget.filename)
+            self.assertEqual(widget.initial_start_dir(), widget.filename)
+            exists.assert_called_once()
+
+            widget.filename = "/foo/baz/baz.csv"
+            self.assertEqual(widget.initial_start_dir(), widget.filename)
+            self.assertEqual(exists.call_count, 2)
+
     def test_default_filter(self):
         class OWSave(OWSaveBase):
             name = "Mock save"
@@ -438,6 +479,41 @@ class TestOWSaveUtils(unittest.TestCase):
         self.assertEqual(replace(fname, ".tab"), fname + ".tab")
         self.assertEqual(replace(fname, ".tab.gz"), fname + ".tab.gz")
 
+        fname = "/bing.bada.boom/foo.TAB"
+        self.assertEqual(replace(fname, ".csv"), fname + ".csv")
+
+        fname = "/bing.bada.boom/.tab.gz"
+        self.assertEqual(replace(fname, ".csv"), "/bing.bada.boom/.tab.csv")
+
+        fname = "/bing.bada.tab/"
+        self.assertEqual(replace(fname, ".csv"), fname + ".csv")
+
+        fname = "foo.tab\n"
+        self.assertEqual(replace(fname, ".csv"), fname + ".csv")
+
+    def test_known_extensions(self):
+        class OWMockSaveBase(OWSaveBase):
+            filters = ["Tab delimited (*.tab)",
+                       "Compressed comma separated (*.csv.gz)",
+                       "Pickle (.pkl)"]
+
+        self.assertEqual(OWMockSaveBase._known_extensions(),
+                         {"tab", "csv", "gz", "pkl"})
+
+        with patch.object(OWMockSaveBase, "filters", ["Excel (*.xlsx)"]):
+            self.assertEqual(OWMockSaveBase._known_extensions(), {"xlsx"})
+
+        class OWMockSaveUpper(OWSaveBase):
+            filters = OWMockSaveBase.filters
+
+            @staticmethod
+            def _extension_from_filter(selected_filter):
+                return OWSaveBase._extension_from_filter(
+                    selected_filter).upper()
+
+        self.assertEqual(OWMockSaveUpper._known_extensions(),
+                         {"TAB", "CSV", "GZ", "PKL"})
+
     def test_extension_from_filter(self):
         eff = OWSaveBase._extension_from_filter
         self.assertEqual(eff("Description (*.ext)"), ".ext")
@@ -445,6 +521,17 @@ class TestOWSaveUtils(unittest.TestCase):
         self.assertEqual(eff("Description (.ext)"), ".ext")
         self.assertEqual(eff("Description (.foo.bar)"), ".foo.bar")
 
+    def test_extension_from_filter_matches_regex(self):
+        for filt in ("Tab delimited (*.tab)",
+                     "Compressed comma separated (*.csv.gz)",
+                     "Description (.foo.bar)",
+                     "Description (x) (*.ext)",
+                     "Description (*.ext) (*)",
+                     "Description (*.)"):
+            self.assertEqual(_parse_filter_extension(filt),
+                             _FILTER_EXT_RE.search(filt).group(1), filt)
+        self.assertRaises(AttributeError, _parse_filter_extension, "(**.ext)")
+
 
 if __name__ == "__main__":
     unittest.main()